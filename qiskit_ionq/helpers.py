@@ -57,6 +57,12 @@ from importlib_metadata import version
 from qiskit_ionq.constants import ErrorMitigation
 from . import exceptions as ionq_exceptions
 
+# orjson is an optional, faster drop-in for decoding API payloads and metadata.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 # the qiskit gates that the IonQ backend can serialize to our IR
 # not the actual hardware basis gates for the system — we do our own transpilation pass.
 # also not an exact/complete list of the gates IonQ's backend takes
@@ -388,25 +394,26 @@ def compress_to_metadata_string(
 
 
 def decompress_metadata_string(
-    input_string: str,
-) -> dict | list:  # pylint: disable=invalid-name
+    input_string: str | None,
+) -> dict | list | None:  # pylint: disable=invalid-name
     """
     Convert compact string format (dumped, gzipped, base64 encoded) from
     IonQ API metadata back into a dict or list of dicts relevant to building
     the results object on a returned job.
 
     Parameters:
-        input_string (str): compressed string format of metadata dict
+        input_string (str): compressed string format of metadata dict, or None
 
     Returns:
-        dict or list: decompressed metadata dict or list of dicts
+        dict or list: decompressed metadata dict or list of dicts, or None
+            if ``input_string`` is None
     """
     if input_string is None:
         return None
     encoded = input_string.encode()
     decoded = base64.b64decode(encoded)
     decompressed = gzip.decompress(decoded)
-    return json.loads(decompressed)
+    return _json_loads(decompressed)
 
 
 def qiskit_to_ionq(
@@ -152,6 +152,8 @@ class IonQBackend(Backend):
             error_mitigation=None,
             extra_query_params={},
             extra_metadata={},
+            poll_interval=None,
+            sort_counts=None,
         )
 
     @property
@@ -355,6 +357,13 @@ class IonQSimulatorBackend(IonQBackend):
         :meth:`get_counts <qiskit_ionq.ionq_job.IonQJob.get_counts>`
         on a job processed by this backend will return counts expressed as
         probabilites, rather than a multiple of shots.
+
+    .. NOTE::
+
+        Sampled counts use ``numpy.random.default_rng``, so a given
+        ``sampler_seed`` produces different counts than releases that used
+        ``numpy.random.RandomState``. Set the ``legacy_rng=True`` option to
+        reproduce those.
     """
 
     @classmethod
@@ -366,6 +375,9 @@ class IonQSimulatorBackend(IonQBackend):
             noise_model="ideal",
             extra_query_params={},
             extra_metadata={},
+            poll_interval=None,
+            sort_counts=None,
+            legacy_rng=False,
         )
 
     # pylint: disable=missing-type-doc,missing-param-doc,arguments-differ,useless-super-delegation
@@ -28,14 +28,12 @@
 
 from __future__ import annotations
 
-import json
-from collections import OrderedDict
 from typing import Optional, TYPE_CHECKING
 from warnings import warn
 import requests
 
 from . import exceptions
-from .helpers import qiskit_to_ionq, get_user_agent, retry
+from .helpers import qiskit_to_ionq, get_user_agent, retry, _json_loads
 from .exceptions import IonQRetriableError
 
 if TYPE_CHECKING:
@@ -279,8 +277,8 @@ class IonQClient:
         req_path = self.make_path("jobs", job_id, "results")
         res = self._get_with_retry(req_path, headers=self.api_headers, params=params)
         exceptions.IonQAPIError.raise_for_status(res)
-        # Use json.loads with object_pairs_hook to maintain order of JSON keys
-        return json.loads(res.text, object_pairs_hook=OrderedDict)
+        # Plain dicts keep the order of JSON keys, which the result mapping relies on.
+        return _json_loads(res.content)
 
 
 __all__ = ["IonQClient"]
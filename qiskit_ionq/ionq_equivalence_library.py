@@ -26,12 +26,20 @@
 
 """Equivalences for IonQ native gates."""
 
+import functools
+
 import numpy as np
 from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
 from qiskit.circuit import QuantumRegister, QuantumCircuit, Parameter
 from qiskit.circuit.library import CXGate, RXGate, RZGate, UGate, XGate, CU3Gate
 from .ionq_gates import GPIGate, GPI2Gate, MSGate
 
+# IonQ native gate phases are expressed in turns; these are the conversion
+# factors to the radian angles used by the standard gates below.
+_TWO_PI = 2 * np.pi
+_FOUR_PI = 4 * np.pi
+_HALF_PI = np.pi / 2
+
 
 def u_gate_equivalence() -> None:
     """Add U gate equivalence to the SessionEquivalenceLibrary."""
@@ -41,16 +49,9 @@ def u_gate_equivalence() -> None:
     lambda_param = Parameter("lambda_param")
     u_gate = QuantumCircuit(q)
     # this sequence can be compacted if virtual-z gates will be introduced
-    u_gate.append(GPI2Gate(0.5 - lambda_param / (2 * np.pi)), [0])
-    u_gate.append(
-        GPIGate(
-            theta_param / (4 * np.pi)
-            + phi_param / (4 * np.pi)
-            - lambda_param / (4 * np.pi)
-        ),
-        [0],
-    )
-    u_gate.append(GPI2Gate(0.5 + phi_param / (2 * np.pi)), [0])
+    u_gate.append(GPI2Gate(0.5 - lambda_param / _TWO_PI), [0])
+    u_gate.append(GPIGate((theta_param + phi_param - lambda_param) / _FOUR_PI), [0])
+    u_gate.append(GPI2Gate(0.5 + phi_param / _TWO_PI), [0])
     SessionEquivalenceLibrary.add_equivalence(
         UGate(theta_param, phi_param, lambda_param), u_gate
     )
@@ -77,7 +78,7 @@ def gpi_gate_equivalence() -> None:
     phi_param = Parameter("phi_param")
     gpi_gate = QuantumCircuit(q)
     gpi_gate.append(XGate(), [0])
-    gpi_gate.append(RZGate(4 * phi_param * np.pi), [0])
+    gpi_gate.append(RZGate(_FOUR_PI * phi_param), [0])
     SessionEquivalenceLibrary.add_equivalence(GPIGate(phi_param), gpi_gate)
 
 
@@ -86,9 +87,9 @@ def gpi2_gate_equivalence() -> None:
     q = QuantumRegister(1, "q")
     phi_param = Parameter("phi_param")
     gpi2_gate = QuantumCircuit(q)
-    gpi2_gate.append(RZGate(-2 * phi_param * np.pi), [0])
-    gpi2_gate.append(RXGate(np.pi / 2), [0])
-    gpi2_gate.append(RZGate(2 * phi_param * np.pi), [0])
+    gpi2_gate.append(RZGate(-_TWO_PI * phi_param), [0])
+    gpi2_gate.append(RXGate(_HALF_PI), [0])
+    gpi2_gate.append(RZGate(_TWO_PI * phi_param), [0])
     SessionEquivalenceLibrary.add_equivalence(GPI2Gate(phi_param), gpi2_gate)
 
 
@@ -105,18 +106,18 @@ def ms_gate_equivalence() -> None:
     ms_gate.x(0)
     ms_gate.append(
         CU3Gate(
-            2 * theta_param * np.pi,
-            2 * alpha_param * np.pi - np.pi / 2,
-            np.pi / 2 - 2 * alpha_param * np.pi,
+            _TWO_PI * theta_param,
+            _TWO_PI * alpha_param - _HALF_PI,
+            _HALF_PI - _TWO_PI * alpha_param,
         ),
         [0, 1],
     )
     ms_gate.x(0)
     ms_gate.append(
         CU3Gate(
-            2 * theta_param * np.pi,
-            -2 * beta_param * np.pi - np.pi / 2,
-            np.pi / 2 + 2 * beta_param * np.pi,
+            _TWO_PI * theta_param,
+            -_TWO_PI * beta_param - _HALF_PI,
+            _HALF_PI + _TWO_PI * beta_param,
         ),
         [0, 1],
     )
@@ -126,8 +127,14 @@ def ms_gate_equivalence() -> None:
     )
 
 
+@functools.cache
 def add_equivalences() -> None:
-    """Add IonQ gate equivalences to the SessionEquivalenceLibrary."""
+    """Add IonQ gate equivalences to the SessionEquivalenceLibrary.
+
+    The equivalence circuits are only built and registered on the first call;
+    later calls (e.g. one per backend instance) are no-ops, so the session
+    library does not accumulate duplicate rules.
+    """
     u_gate_equivalence()
     cx_gate_equivalence()
     gpi_gate_equivalence()
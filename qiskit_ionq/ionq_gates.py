@@ -27,11 +27,39 @@
 """Native gateset for IonQ hardware."""
 
 from typing import Optional
+import cmath
+import functools
 import math
 import numpy as np
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.parameterexpression import ParameterValueType
 
+# GPI2 normalisation folded into its matrix coefficients.
+_INV_SQRT2 = 1 / math.sqrt(2)
+_NEG_J_INV_SQRT2 = -1j / math.sqrt(2)
+
+# Zero-filled 4x4 buffer copied for each MS matrix, so that only the eight
+# non-zero entries have to be written per call.
+_MS_TEMPLATE = np.zeros((4, 4), dtype=complex)
+_MS_TEMPLATE.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=128)
+def _zz_diagonal(theta: ParameterValueType) -> np.ndarray:
+    """Return the read-only ZZ diagonal for ``theta``, caching recent angles."""
+    exp_pos = cmath.exp(1j * theta * math.pi)
+    exp_neg = exp_pos.conjugate()
+    diag = np.array([exp_neg, exp_pos, exp_pos, exp_neg], dtype=complex)
+    diag.setflags(write=False)
+    return diag
+
+
+def _as_dtype(mat: np.ndarray, dtype=None) -> np.ndarray:
+    """Cast a gate matrix to ``dtype``, without copying if no cast is needed."""
+    if dtype is None:
+        return mat
+    return mat.astype(dtype, copy=False)
+
 
 class GPIGate(Gate):
     r"""Single-qubit GPI gate.
@@ -57,9 +85,32 @@ class GPIGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy array for the GPI gate."""
-        top = np.exp(-1j * 2 * math.pi * self.params[0])
-        bottom = np.exp(1j * 2 * math.pi * self.params[0])
-        return np.array([[0, top], [bottom, 0]], dtype=dtype)
+        return _as_dtype(self.to_matrix(), dtype)
+
+    @staticmethod
+    def matrices(phis) -> np.ndarray:
+        """Return GPI matrices for an array of phases, see :func:`gpi_batch`."""
+        return gpi_batch(phis)
+
+    def to_matrix(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a C-contiguous complex matrix for the GPI gate.
+
+        Args:
+            out (np.ndarray): Optional preallocated ``(2, 2)`` complex array
+                to write the matrix into, so that repeated evaluations can
+                reuse one buffer instead of allocating.
+
+        Returns:
+            np.ndarray: The gate matrix (``out``, if it was given).
+        """
+        bottom = cmath.exp(1j * 2 * math.pi * self.params[0])
+        if out is None:
+            out = np.zeros((2, 2), dtype=complex)
+        else:
+            out[0, 0] = out[1, 1] = 0
+        out[0, 1] = bottom.conjugate()
+        out[1, 0] = bottom
+        return out
 
 
 class GPI2Gate(Gate):
@@ -87,9 +138,31 @@ class GPI2Gate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy array for the GPI2 gate."""
-        top = -1j * np.exp(-1j * self.params[0] * 2 * math.pi)
-        bottom = -1j * np.exp(1j * self.params[0] * 2 * math.pi)
-        return 1 / np.sqrt(2) * np.array([[1, top], [bottom, 1]], dtype=dtype)
+        return _as_dtype(self.to_matrix(), dtype)
+
+    @staticmethod
+    def matrices(phis) -> np.ndarray:
+        """Return GPI2 matrices for an array of phases, see :func:`gpi2_batch`."""
+        return gpi2_batch(phis)
+
+    def to_matrix(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a C-contiguous complex matrix for the GPI2 gate.
+
+        Args:
+            out (np.ndarray): Optional preallocated ``(2, 2)`` complex array
+                to write the matrix into, so that repeated evaluations can
+                reuse one buffer instead of allocating.
+
+        Returns:
+            np.ndarray: The gate matrix (``out``, if it was given).
+        """
+        exp_phi = cmath.exp(1j * self.params[0] * 2 * math.pi)
+        if out is None:
+            out = np.empty((2, 2), dtype=complex)
+        out[0, 0] = out[1, 1] = _INV_SQRT2
+        out[0, 1] = _NEG_J_INV_SQRT2 * exp_phi.conjugate()
+        out[1, 0] = _NEG_J_INV_SQRT2 * exp_phi
+        return out
 
 
 class MSGate(Gate):
@@ -131,21 +204,42 @@ class MSGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy array for the MS gate."""
-        phi0 = self.params[0]
-        phi1 = self.params[1]
-        theta = self.params[2]
-        diag = np.cos(math.pi * theta)
-        sin = np.sin(math.pi * theta)
-
-        return np.array(
-            [
-                [diag, 0, 0, sin * -1j * np.exp(-1j * 2 * math.pi * (phi0 + phi1))],
-                [0, diag, sin * -1j * np.exp(1j * 2 * math.pi * (phi0 - phi1)), 0],
-                [0, sin * -1j * np.exp(-1j * 2 * math.pi * (phi0 - phi1)), diag, 0],
-                [sin * -1j * np.exp(1j * 2 * math.pi * (phi0 + phi1)), 0, 0, diag],
-            ],
-            dtype=dtype,
-        )
+        return _as_dtype(self.to_matrix(), dtype)
+
+    @staticmethod
+    def matrices(phi0s, phi1s, thetas=0.25) -> np.ndarray:
+        """Return MS matrices for arrays of parameters, see :func:`ms_batch`."""
+        return ms_batch(phi0s, phi1s, thetas)
+
+    def to_matrix(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a C-contiguous complex matrix for the MS gate.
+
+        Args:
+            out (np.ndarray): Optional preallocated ``(4, 4)`` complex array
+                to write the matrix into, so that repeated evaluations can
+                reuse one buffer instead of allocating.
+
+        Returns:
+            np.ndarray: The gate matrix (``out``, if it was given).
+        """
+        phi0, phi1, theta = self.params
+        diag = math.cos(math.pi * theta)
+        coupling = -1j * math.sin(math.pi * theta)
+        # The anti-diagonal entries come in complex-conjugate pairs, so only
+        # one exponential per pair needs to be evaluated.
+        exp_sum = cmath.exp(1j * 2 * math.pi * (phi0 + phi1))
+        exp_diff = cmath.exp(1j * 2 * math.pi * (phi0 - phi1))
+
+        if out is None:
+            out = _MS_TEMPLATE.copy()
+        else:
+            out.fill(0)
+        out[0, 0] = out[1, 1] = out[2, 2] = out[3, 3] = diag
+        out[0, 3] = coupling * exp_sum.conjugate()
+        out[1, 2] = coupling * exp_diff
+        out[2, 1] = coupling * exp_diff.conjugate()
+        out[3, 0] = coupling * exp_sum
+        return out
 
 
 class ZZGate(Gate):
@@ -172,15 +266,125 @@ class ZZGate(Gate):
         """Create new ZZ gate."""
         super().__init__("zz", 2, [theta], label=label)
 
+    def diagonal(self) -> np.ndarray:
+        """Return the diagonal of the ZZ gate matrix.
+
+        The ZZ gate is diagonal in the computational basis, so simulators that
+        support diagonal operators can apply it as an elementwise product
+        instead of a dense 4x4 matrix multiplication.
+
+        Returns:
+            np.ndarray: A length-4 complex vector.
+        """
+        return _zz_diagonal(self.params[0]).copy()
+
     def __array__(self, dtype=None) -> np.ndarray:
         """Return a numpy array for the ZZ gate."""
-        itheta2 = 1j * float(self.params[0]) * math.pi
-        return np.array(
-            [
-                [np.exp(-itheta2), 0, 0, 0],
-                [0, np.exp(itheta2), 0, 0],
-                [0, 0, np.exp(itheta2), 0],
-                [0, 0, 0, np.exp(-itheta2)],
-            ],
-            dtype=dtype,
-        )
+        return _as_dtype(self.to_matrix(), dtype)
+
+    @staticmethod
+    def matrices(thetas) -> np.ndarray:
+        """Return ZZ matrices for an array of angles, see :func:`zz_batch`."""
+        return zz_batch(thetas)
+
+    def to_matrix(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a C-contiguous complex matrix for the ZZ gate.
+
+        Args:
+            out (np.ndarray): Optional preallocated ``(4, 4)`` complex array
+                to write the matrix into, so that repeated evaluations can
+                reuse one buffer instead of allocating.
+
+        Returns:
+            np.ndarray: The gate matrix (``out``, if it was given).
+        """
+        if out is None:
+            out = np.zeros((4, 4), dtype=complex)
+        else:
+            out.fill(0)
+        np.fill_diagonal(out, _zz_diagonal(self.params[0]))
+        return out
+
+
+def gpi_batch(phis) -> np.ndarray:
+    """Build GPI matrices for an array of phases in one vectorized pass.
+
+    Args:
+        phis (array_like): Phases of the GPI gates, in turns.
+
+    Returns:
+        np.ndarray: A ``(..., 2, 2)`` complex array, one matrix per phase.
+    """
+    phis = np.asarray(phis, dtype=float)
+    bottom = np.exp(1j * 2 * math.pi * phis)
+    out = np.zeros(phis.shape + (2, 2), dtype=complex)
+    out[..., 0, 1] = bottom.conj()
+    out[..., 1, 0] = bottom
+    return out
+
+
+def gpi2_batch(phis) -> np.ndarray:
+    """Build GPI2 matrices for an array of phases in one vectorized pass.
+
+    Args:
+        phis (array_like): Phases of the GPI2 gates, in turns.
+
+    Returns:
+        np.ndarray: A ``(..., 2, 2)`` complex array, one matrix per phase.
+    """
+    phis = np.asarray(phis, dtype=float)
+    exp_phi = np.exp(1j * 2 * math.pi * phis)
+    out = np.empty(phis.shape + (2, 2), dtype=complex)
+    out[..., 0, 0] = out[..., 1, 1] = _INV_SQRT2
+    out[..., 0, 1] = _NEG_J_INV_SQRT2 * exp_phi.conj()
+    out[..., 1, 0] = _NEG_J_INV_SQRT2 * exp_phi
+    return out
+
+
+def ms_batch(phi0s, phi1s, thetas=0.25) -> np.ndarray:
+    """Build MS matrices for arrays of parameters in one vectorized pass.
+
+    The parameter arrays are broadcast against each other.
+
+    Args:
+        phi0s (array_like): Phases of the first qubit, in turns.
+        phi1s (array_like): Phases of the second qubit, in turns.
+        thetas (array_like): Entangling angles, in turns.
+
+    Returns:
+        np.ndarray: A ``(..., 4, 4)`` complex array, one matrix per parameter set.
+    """
+    phi0s, phi1s, thetas = np.broadcast_arrays(
+        np.asarray(phi0s, dtype=float),
+        np.asarray(phi1s, dtype=float),
+        np.asarray(thetas, dtype=float),
+    )
+    diag = np.cos(math.pi * thetas)
+    sin = np.sin(math.pi * thetas)
+    exp_sum = -1j * sin * np.exp(1j * 2 * math.pi * (phi0s + phi1s))
+    exp_diff = -1j * sin * np.exp(1j * 2 * math.pi * (phi0s - phi1s))
+    out = np.zeros(thetas.shape + (4, 4), dtype=complex)
+    for i in range(4):
+        out[..., i, i] = diag
+    out[..., 0, 3] = -exp_sum.conj()
+    out[..., 1, 2] = exp_diff
+    out[..., 2, 1] = -exp_diff.conj()
+    out[..., 3, 0] = exp_sum
+    return out
+
+
+def zz_batch(thetas) -> np.ndarray:
+    """Build ZZ matrices for an array of angles in one vectorized pass.
+
+    Args:
+        thetas (array_like): Rotation angles of the ZZ gates, in turns.
+
+    Returns:
+        np.ndarray: A ``(..., 4, 4)`` complex array, one matrix per angle.
+    """
+    thetas = np.asarray(thetas, dtype=float)
+    exp_pos = np.exp(1j * math.pi * thetas)
+    out = np.zeros(thetas.shape + (4, 4), dtype=complex)
+    out[..., 0, 0] = out[..., 3, 3] = exp_pos.conj()
+    out[..., 1, 1] = out[..., 2, 2] = exp_pos
+    return out
@@ -37,8 +37,12 @@
 
 from __future__ import annotations
 
+import random
+import time
 import warnings
-from typing import TYPE_CHECKING, Any, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Mapping, Sequence, Optional
 import numpy as np
 
 from qiskit import QuantumCircuit
@@ -53,36 +57,221 @@ if TYPE_CHECKING:
     from . import ionq_backend
     from . import ionq_client
 
+# Qiskit exposes the final job states as a tuple; keep a set for O(1) lookups
+# in the status polling path.
+_FINAL_STATES = frozenset(jobstatus.JOB_FINAL_STATES)
+
+# IonQ API job status strings mapped to qiskit job statuses.
+_QISKIT_STATUSES = {
+    api_status.value: jobstatus.JobStatus[constants.JobStatusMap[api_status.name].value]
+    for api_status in constants.APIJobStatus
+}
+
+# Seconds between status polls while waiting on a job, and the floor applied
+# to user-provided intervals. Status calls made within the floor of the last
+# poll reuse its answer instead of making another API request.
+_DEFAULT_POLL_INTERVAL = 5.0
+_MIN_POLL_INTERVAL = 0.1
+
+# Without an explicit ``wait``, the poll interval grows by this factor after
+# each query, up to the cap, so long queue waits make fewer API requests.
+_POLL_BACKOFF = 1.5
+_MAX_POLL_INTERVAL = 30.0
+# Relative jitter on backed-off sleeps, so jobs polled together drift apart.
+_POLL_JITTER = 0.1
+
+# Histograms smaller than this are remapped with plain Python integer ops.
+_SCALAR_MAP_THRESHOLD = 64
+
+# Remapped outcomes are summed into a dense table when the output space is at
+# most this many times larger than the histogram, avoiding a sort.
+_DENSE_MAP_RATIO = 4
+
+# Upper bound on concurrent requests when fetching a job's children.
+_MAX_CHILD_WORKERS = 16
+
+
+def _to_qiskit_status(api_status):
+    """Map an IonQ API job status string to a qiskit job status.
+
+    Args:
+        api_status (str): The ``status`` field of an IonQ API job response.
+
+    Returns:
+        JobStatus: The matching qiskit job status.
+
+    Raises:
+        IonQJobError: If the IonQ job status is unknown.
+    """
+    try:
+        return _QISKIT_STATUSES[api_status]
+    except (KeyError, TypeError) as ex:
+        raise exceptions.IonQJobError(f"Unknown job status {api_status}") from ex
+
+
+def _map_output_arrays(data, clbits, num_qubits):
+    """Map a histogram according to measured bits, as parallel arrays.
+
+    Args:
+        data (dict): histogram as returned by the API.
+        clbits (List[int]): array of classical bits for measurements
+        num_qubits (int): number of qubits
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): The distinct mapped outcomes, in
+            first-seen order, and their summed probabilities.
+    """
+    if not clbits or not data:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    # Measuring every qubit in order maps each in-range value onto itself.
+    identity = num_qubits < 63 and list(clbits) == list(range(num_qubits))
+
+    # For small histograms, plain integer bit-ops beat NumPy's setup cost.
+    if len(data) < _SCALAR_MAP_THRESHOLD:
+        if identity:
+            upper = 1 << num_qubits
+            mapped = {}
+            for value, probability in data.items():
+                value = int(value)
+                if not 0 <= value < upper:
+                    break
+                mapped[value] = mapped.get(value, 0.0) + probability
+            else:
+                return (
+                    np.fromiter(mapped, dtype=np.int64, count=len(mapped)),
+                    np.fromiter(mapped.values(), dtype=float, count=len(mapped)),
+                )
+        positions = [
+            (position, bit)
+            for position, bit in enumerate(clbits)
+            if bit is not None and bit >= 0
+        ]
+        mapped = {}
+        for value, probability in data.items():
+            value = int(value)
+            outvalue = 0
+            for position, bit in positions:
+                outvalue |= ((value >> bit) & 1) << position
+            mapped[outvalue] = mapped.get(outvalue, 0.0) + probability
+        return (
+            np.fromiter(mapped, dtype=np.int64, count=len(mapped)),
+            np.fromiter(mapped.values(), dtype=float, count=len(mapped)),
+        )
+
+    num_values = len(data)
+    values = np.fromiter(map(int, data), dtype=np.int64, count=num_values)
+    probabilities = np.fromiter(data.values(), dtype=float, count=num_values)
+
+    if identity and values.min() >= 0 and values.max() < 1 << num_qubits:
+        return values, probabilities
+
+    # Bit ``j`` of each output value is bit ``clbits[j]`` of the input value;
+    # missing or out-of-range bits read as 0. Accumulating one clbit at a time
+    # avoids a (num_values, num_clbits) temporary.
+    outvalues = np.zeros(num_values, dtype=np.int64)
+    scratch = np.empty_like(outvalues)
+    width = 0
+    for position, bit in enumerate(clbits):
+        if bit is not None and 0 <= bit < 63:
+            width = position + 1
+            np.right_shift(values, bit, out=scratch)
+            np.bitwise_and(scratch, 1, out=scratch)
+            np.left_shift(scratch, position, out=scratch)
+            np.bitwise_or(outvalues, scratch, out=outvalues)
+
+    # Sum probabilities per output value, keeping first-seen order.
+    if 1 << width <= _DENSE_MAP_RATIO * num_values:
+        totals = np.bincount(outvalues, weights=probabilities, minlength=1 << width)
+        first_seen = np.full(1 << width, num_values)
+        np.minimum.at(first_seen, outvalues, np.arange(num_values))
+        unique = np.flatnonzero(first_seen < num_values)
+        unique = unique[np.argsort(first_seen[unique])]
+        return unique, totals[unique]
+
+    unique, first_seen, inverse = np.unique(
+        outvalues, return_index=True, return_inverse=True
+    )
+    totals = np.bincount(inverse.ravel(), weights=probabilities)
+    order = np.argsort(first_seen)
+    return unique[order], totals[order]
+
 
 def map_output(data, clbits, num_qubits):
     """Map histogram according to measured bits"""
+    outcomes, probabilities = _map_output_arrays(data, clbits, num_qubits)
+    return dict(zip(outcomes.tolist(), probabilities.tolist()))
+
+
+def _result_cache_key(sharpen, extra_query_params):
+    """Build the key under which a job's formatted results are cached.
 
-    if not clbits:
-        return {}
+    Args:
+        sharpen (bool): The ``sharpen`` argument given to :meth:`IonQJob.result`.
+        extra_query_params (dict): The extra query parameters given with it.
 
-    mapped_output = {}
+    Returns:
+        tuple: A hashable key, or ``None`` if the parameters are not hashable.
+    """
+    try:
+        return (sharpen, frozenset((extra_query_params or {}).items()))
+    except TypeError:
+        return None
 
-    def get_bitvalue(bitstring, bit):
-        if bit is not None and 0 <= bit < len(bitstring):
-            return bitstring[bit]
-        return "0"
 
-    for value, probability in data.items():
-        bitstring = bin(int(value))[2:].rjust(num_qubits, "0")[::-1]
+def _parse_count(value, default):
+    """Parse a non-negative integer from job metadata.
 
-        outvalue = int(
-            "".join([get_bitvalue(bitstring, bit) for bit in clbits])[::-1], 2
-        )
+    Args:
+        value (Any): The raw metadata value, usually a string.
+        default (Any): Returned when ``value`` is missing, malformed or negative.
 
-        mapped_output[outvalue] = mapped_output.get(outvalue, 0) + probability
+    Returns:
+        int: The parsed value, or ``default``.
+    """
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed >= 0 else default
 
-    return mapped_output
 
+def _apportion_shots(probs, shots):
+    """Split ``shots`` across outcomes in proportion to ``probs``.
 
-def _build_counts(
-    data, num_qubits, clbits, shots, use_sampler=False, sampler_seed=None
+    Uses the largest-remainder method, so the counts always sum to ``shots``
+    even when the probabilities carry floating point error.
+
+    Args:
+        probs (np.ndarray): Outcome probabilities.
+        shots (int): Total number of shots.
+
+    Returns:
+        np.ndarray: Integer counts per outcome.
+    """
+    total = probs.sum()
+    if total <= 0:
+        return np.zeros(probs.shape, dtype=np.int64)
+    scaled = probs * (shots / total)
+    counts = np.floor(scaled).astype(np.int64)
+    remainder = shots - int(counts.sum())
+    if remainder > 0:
+        order = np.argsort(counts - scaled, kind="stable")
+        counts[order[:remainder]] += 1
+    return counts
+
+
+def _count_arrays(
+    data,
+    num_qubits,
+    clbits,
+    shots,
+    use_sampler=False,
+    sampler_seed=None,
+    sort=None,
+    legacy_rng=False,
 ):  # pylint: disable=too-many-positional-arguments
-    """Map IonQ's ``counts`` onto qiskit's ``counts`` model.
+    """Map IonQ's ``counts`` onto qiskit's ``counts`` model, as parallel arrays.
 
     .. NOTE:: For simulator jobs, this method builds counts using a randomly
         generated sampling of the probabilities returned from the API. Because
@@ -95,17 +284,19 @@ def _build_counts(
         num_qubits (int): number of qubits
         clbits (List[int]): array of classical bits for measurements
         shots (int): number of shots
-        use_sampler (bool): for counts generation, whether to use
-            simple shots * probabilities (for qpu) or a sampler (for simulator)
+        use_sampler (bool): for counts generation, whether to apportion
+            shots by probability (for qpu) or use a sampler (for simulator)
         sampler_seed (int): ability to provide a seed for the randomness in the
             sampler for repeatable results. passed as
-            `np.random.RandomState(seed)`. If none, `np.random` is used
+            `np.random.default_rng(seed)`. If none, fresh entropy is used
+        sort (str): optional output order: ``"key"`` sorts by outcome,
+            ``"value"`` by descending count. If none, API order is kept.
+        legacy_rng (bool): sample with the legacy ``np.random.RandomState``
+            instead, to reproduce seeded counts from earlier releases.
 
     Returns:
-        tuple(dict[str, float], dict[str, float]): A tuple (counts, probabilities),
-            respectively a dict of qiskit compatible ``counts`` and a dict of
-            the job's probabilities as a``Counts`` object, mostly relevant for
-            simulator work.
+        tuple(np.ndarray, np.ndarray, np.ndarray): The measured outcomes with a
+            non-zero count, their counts and their probabilities.
 
     Raises:
         IonQJobError: In the event that ``result`` has missing or invalid job
@@ -116,35 +307,97 @@ def _build_counts(
         raise exceptions.IonQJobError("Cannot remap counts without data!")
 
     # Grab the mapped output from response.
-    output_probs = map_output(data, clbits, num_qubits)
+    outcomes, probs = _map_output_arrays(data, clbits, num_qubits)
+
+    # Nothing was measured, so there is nothing to count or sample.
+    num_outcomes = len(outcomes)
+    if not num_outcomes:
+        return outcomes, np.empty(0, dtype=np.int64), probs
 
-    sampled = {}
     if use_sampler:
-        rand = np.random.RandomState(sampler_seed)
-        outcomes, weights = zip(*output_probs.items())
-        weights = np.array(weights, dtype=float)
+        total = probs.sum()
+        if total <= 0:
+            raise exceptions.IonQJobError(
+                "Cannot sample counts from an empty probability distribution!"
+            )
         # just in case the sum isn't exactly 1 — sometimes the API returns
         #  e.g. 0.499999 due to floating point error
-        weights /= weights.sum()
-        sample_counts = np.bincount(
-            rand.choice(len(outcomes), shots, p=weights), minlength=len(outcomes)
-        )
-        sampled = dict(zip(outcomes, sample_counts))
-
-    # Build counts and probabilities
-    counts = {}
-    probabilities = {}
-    for key, val in output_probs.items():
-        bits = bin(int(key))[2:].rjust(num_qubits, "0")
-        hex_bits = hex(int(bits, 2))
-        count = sampled[key] if use_sampler else round(val * shots)
-        if count > 0:  # Check to ensure only non-zero counts are added
-            counts[hex_bits] = count
-            probabilities[hex_bits] = val
+        weights = probs / total
+        if legacy_rng:
+            # Per-shot draws, matching the counts of earlier releases.
+            rand = np.random.RandomState(sampler_seed)
+            count_values = np.bincount(
+                rand.choice(num_outcomes, shots, p=weights), minlength=num_outcomes
+            )
+        else:
+            # Draw the whole count vector at once rather than sampling each shot.
+            rand = np.random.default_rng(sampler_seed)
+            count_values = rand.multinomial(shots, weights)
+    else:
+        count_values = _apportion_shots(probs, shots)
+
+    # Build counts and probabilities, keeping only non-zero counts.
+    keep = np.flatnonzero(count_values > 0)
+    if sort == "key":
+        keep = keep[np.argsort(outcomes[keep], kind="stable")]
+    elif sort == "value":
+        keep = keep[np.argsort(-count_values[keep], kind="stable")]
+    elif sort is not None:
+        raise exceptions.IonQJobError(f"Unknown counts sort order {sort!r}")
+    return outcomes[keep], count_values[keep], probs[keep]
+
+
+def _counts_dicts(outcomes, count_values, probs):
+    """Format the arrays from :func:`_count_arrays` as hex-keyed dicts.
+
+    Args:
+        outcomes (np.ndarray): Measured outcomes.
+        count_values (np.ndarray): Counts per outcome.
+        probs (np.ndarray): Probabilities per outcome.
 
+    Returns:
+        tuple(dict[str, int], dict[str, float]): A tuple (counts, probabilities).
+    """
+    hex_keys = list(map(hex, outcomes.tolist()))
+    counts = dict(zip(hex_keys, count_values.tolist()))
+    probabilities = dict(zip(hex_keys, probs.tolist()))
     return counts, probabilities
 
 
+def _build_counts(
+    data,
+    num_qubits,
+    clbits,
+    shots,
+    use_sampler=False,
+    sampler_seed=None,
+    sort=None,
+    legacy_rng=False,
+):  # pylint: disable=too-many-positional-arguments
+    """Map IonQ's ``counts`` onto qiskit's ``counts`` model.
+
+    Arguments are as for :func:`_count_arrays`.
+
+    Returns:
+        tuple(dict[str, float], dict[str, float]): A tuple (counts, probabilities),
+            respectively a dict of qiskit compatible ``counts`` and a dict of
+            the job's probabilities as a``Counts`` object, mostly relevant for
+            simulator work.
+    """
+    return _counts_dicts(
+        *_count_arrays(
+            data,
+            num_qubits,
+            clbits,
+            shots,
+            use_sampler=use_sampler,
+            sampler_seed=sampler_seed,
+            sort=sort,
+            legacy_rng=legacy_rng,
+        )
+    )
+
+
 class IonQJob(JobV1):
     """Representation of a Job that will run on an IonQ backend.
 
@@ -153,6 +406,9 @@ class IonQJob(JobV1):
     methods on sub-class instances of IonQBackend to create and retrieve jobs
     (both methods return a job instance).
 
+    Jobs created from an existing ``job_id`` do not contact the API until their
+    status or result is first requested; pass ``lazy=False`` to fetch eagerly.
+
     Attributes:
         circuit(:mod:`QuantumCircuit <qiskit.QuantumCircuit>`): A possibly ``None``
             Qiskit quantum circuit.
@@ -160,6 +416,15 @@ class IonQJob(JobV1):
             The actual Qiskit Result of this job when done.
     """
 
+    # Names of the per-status handlers applied to each job response.
+    _STATUS_HANDLERS: ClassVar[Mapping[jobstatus.JobStatus, str]] = MappingProxyType(
+        {
+            jobstatus.JobStatus.DONE: "_handle_done",
+            jobstatus.JobStatus.ERROR: "_handle_error",
+            jobstatus.JobStatus.CANCELLED: "_handle_cancelled",
+        }
+    )
+
     def __init__(
         self,
         backend: ionq_backend.IonQBackend,
@@ -167,26 +432,44 @@ class IonQJob(JobV1):
         client: Optional[ionq_client.IonQClient] = None,
         circuit: Optional[QuantumCircuit] = None,
         passed_args: Optional[dict] = None,
+        lazy: bool = True,
     ):  # pylint: disable=too-many-positional-arguments
         assert (
             job_id is not None or circuit is not None
         ), "Job must have a job_id or circuit"
         super().__init__(backend, job_id)
         self._client = client or backend.client
-        self._result = None
+        self._result: Optional[Result] = None
+        self._results: dict[tuple, Result] = {}
         self._status = None
         self._execution_time = None
         self._metadata: dict[str, Any] = {}
-
+        self._num_circuits = 1
+        # Child job ids, known once a full job response has been applied.
+        self._children: Optional[list[str]] = None
+        self._child_statuses: dict[str, jobstatus.JobStatus] = {}
+        self._num_qubits = 0
+        self._clbits: list[list[int]] = []
+        self._last_poll_time: Optional[float] = None
+        self._header_cache: Optional[tuple[Optional[str], list]] = None
+
+        poll_interval = None
         if passed_args is not None:
             self.extra_query_params = passed_args.pop("extra_query_params", {})
             self.extra_metadata = passed_args.pop("extra_metadata", {})
+            poll_interval = passed_args.pop("poll_interval", None)
             self._passed_args = passed_args
         else:
             self.extra_query_params = {}
             self.extra_metadata = {}
             self._passed_args = {"shots": 1024, "sampler_seed": None}
 
+        if poll_interval is None:
+            poll_interval = getattr(backend.options, "poll_interval", None)
+        if poll_interval is None:
+            poll_interval = _DEFAULT_POLL_INTERVAL
+        self._poll_interval = max(poll_interval, _MIN_POLL_INTERVAL)
+
         # Handle both single and list of circuits
         if circuit is not None:
             self.circuit = circuit
@@ -195,7 +478,8 @@ class IonQJob(JobV1):
             self.circuit = None
             self._status = jobstatus.JobStatus.INITIALIZING
             self._job_id = job_id
-            self.status()
+            if not lazy:
+                self.status()
 
     def cancel(self) -> None:
         """Cancel this job."""
@@ -217,6 +501,13 @@ class IonQJob(JobV1):
         response = self._client.submit_job(job=self)
         self._job_id = response["id"]
 
+        # The submission ack carries the job's initial status; treat it as a
+        # fresh poll. Final states still need a full fetch for their results.
+        status = _QISKIT_STATUSES.get(response.get("status"))
+        if status is not None and status not in _FINAL_STATES:
+            self._status = status
+            self._last_poll_time = time.monotonic()
+
     def get_counts(self, circuit: Optional[QuantumCircuit] = None) -> dict:
         """Return the counts for the job.
 
@@ -257,6 +548,7 @@ class IonQJob(JobV1):
         self,
         sharpen: bool | None = None,
         extra_query_params: dict | None = None,
+        refresh: bool = False,
         **kwargs,
     ):
         """Retrieve job result data.
@@ -269,6 +561,16 @@ class IonQJob(JobV1):
         :meth:`wait_for_final_state <qiskit.providers.BaseJob.wait_for_final_state>`
         method to poll for a completed job.
 
+        Results of a finished job are cached per ``sharpen`` and
+        ``extra_query_params`` combination.
+
+        Args:
+            sharpen (bool): Whether to request sharpened (debiased) results.
+            extra_query_params (dict): Extra query parameters for the results request.
+            refresh (bool): If True, fetch the results again instead of using
+                the cache.
+            kwargs: Passed to :meth:`wait_for_final_state`.
+
         Raises:
             IonQJobTimeoutError: If after the default wait period in
                 :meth:`wait_for_final_state <qiskit.providers.BaseJob.wait_for_final_state>`
@@ -277,12 +579,11 @@ class IonQJob(JobV1):
                 the job itself was never converted to a
                 :class:`Result <qiskit.result.Result>`.
             IonQJobStateError: If the job was cancelled before this method fetches it.
+            IonQJobFailureError: If the job failed.
 
         Returns:
             Result: A Qiskit :class:`Result <qiskit.result.Result>` representation of this job.
         """
-        # TODO: cache results by sharpen
-
         if sharpen is not None and not isinstance(sharpen, bool):
             warnings.warn("Invalid sharpen type")
 
@@ -294,6 +595,9 @@ class IonQJob(JobV1):
                 "Timed out waiting for job to complete."
             ) from ex
 
+        if self._status is jobstatus.JobStatus.ERROR:
+            self._handle_error(self._metadata)
+
         if self._status is jobstatus.JobStatus.CANCELLED:
             assert self._job_id is not None
             raise exceptions.IonQJobStateError(
@@ -302,20 +606,72 @@ class IonQJob(JobV1):
 
         if self._status is jobstatus.JobStatus.DONE:
             assert self._job_id is not None
-            response = self._client.get_results(
-                job_id=self._job_id,
-                sharpen=sharpen,
-                extra_query_params=extra_query_params,
-            )
-            self._result = self._format_result(response)
+            # Results of a finished job never change, so reuse them per request.
+            cache_key = _result_cache_key(sharpen, extra_query_params)
+            cached = None if refresh else self._results.get(cache_key)
+            if cached is None:
+                response = self._client.get_results(
+                    job_id=self._job_id,
+                    sharpen=sharpen,
+                    extra_query_params=extra_query_params,
+                )
+                cached = self._format_result(response)
+                if cache_key is not None:
+                    self._results[cache_key] = cached
+            self._result = cached
 
         return self._result
 
-    def status(self, detailed: bool = False) -> jobstatus.JobStatus | dict:
+    def wait_for_final_state(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        callback: Optional[Callable] = None,
+    ) -> None:
+        """Poll the job status until it progresses to a final state.
+
+        Args:
+            timeout (float): Seconds to wait for the job. If ``None``, wait
+                indefinitely.
+            wait (float): Seconds between status queries, never lower than
+                0.1 seconds. If ``None``, polling starts at the job's poll
+                interval and backs off by 1.5x per query, up to 30 seconds,
+                with +/-10% jitter.
+            callback (Callable): Callback function invoked after each query,
+                see :meth:`JobV1.wait_for_final_state
+                <qiskit.providers.JobV1.wait_for_final_state>`.
+
+        Raises:
+            JobTimeoutError: If the job does not reach a final state before the
+                specified timeout.
+        """
+        backoff = wait is None
+        wait = max(self._poll_interval if wait is None else wait, _MIN_POLL_INTERVAL)
+        start_time = time.monotonic()
+        status = self.status(raise_on_error=False)
+        while status not in _FINAL_STATES:
+            elapsed_time = time.monotonic() - start_time
+            if timeout is not None and elapsed_time >= timeout:
+                raise JobTimeoutError(f"Timeout while waiting for job {self.job_id()}.")
+            if callback:
+                callback(self.job_id(), status, self)
+            sleep = wait
+            if backoff:
+                sleep *= 1 + random.uniform(-_POLL_JITTER, _POLL_JITTER)
+            time.sleep(sleep if timeout is None else min(sleep, timeout - elapsed_time))
+            if backoff and wait < _MAX_POLL_INTERVAL:
+                wait = min(wait * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+            status = self.status(raise_on_error=False)
+
+    def status(
+        self, detailed: bool = False, raise_on_error: bool = True
+    ) -> jobstatus.JobStatus | dict:
         """Retrieve the status of a job
 
         Args:
             detailed (bool): If True, returns a detailed status of children.
+            raise_on_error (bool): If True, raise when a poll finds the job
+                failed. If False, only record the ``ERROR`` status.
 
         Returns:
             JobStatus or dict: An enum value from Qiskit's
@@ -325,93 +681,156 @@ class IonQJob(JobV1):
         Raises:
             IonQJobError: If the IonQ job status was unknown or otherwise
                 unmappable to a qiskit job status.
-            IonQJobFailureError: If the job fails
-            IonQJobStateError: If the job was cancelled
+            IonQJobFailureError: If the job fails and ``raise_on_error`` is True.
         """
         # Return early if we have no job id yet.
         if self._job_id is None:
             return self._status
 
-        # Return early if the job is already done.
-        if self._status in jobstatus.JOB_FINAL_STATES:
+        # Return early if the job is already done, or was polled moments ago.
+        now = time.monotonic()
+        if self._status in _FINAL_STATES or (
+            self._last_poll_time is not None
+            and now - self._last_poll_time < _MIN_POLL_INTERVAL
+        ):
             if detailed:
                 return self._children_status()
             return self._status
 
-        # Otherwise, look up a status enum from the response.
+        # Otherwise, fetch the job and apply the response.
         response = self._client.retrieve_job(self._job_id)
-        api_response_status = response.get("status")
-        status_enum: Union[
-            constants.APIJobStatus, constants.JobStatusMap, jobstatus.JobStatus
+        self._last_poll_time = now
+        self._apply_response(response, raise_on_error)
+
+        if detailed:
+            return self._children_status()
+
+        return self._status
+
+    @staticmethod
+    def poll_many(
+        jobs: Sequence[IonQJob], max_workers: int = 8
+    ) -> list[jobstatus.JobStatus]:
+        """Retrieve the status of several jobs, fetching them concurrently.
+
+        Jobs that have no job id yet, or that are already in a final state, are
+        not fetched again. Failed jobs are reported as ``ERROR`` rather than
+        raising, so one failure does not discard the other jobs' statuses.
+
+        Args:
+            jobs (Sequence[IonQJob]): The jobs to poll.
+            max_workers (int): Maximum number of concurrent API requests.
+
+        Returns:
+            list[JobStatus]: The status of each job, in the order given.
+
+        Raises:
+            IonQJobError: If an IonQ job status was unknown or otherwise
+                unmappable to a qiskit job status.
+        """
+        pending = [
+            job
+            for job in jobs
+            if job._job_id is not None and job._status not in _FINAL_STATES
         ]
-        try:
-            status_enum = constants.APIJobStatus(api_response_status)
-        except ValueError as ex:
-            raise exceptions.IonQJobError(
-                f"Unknown job status {api_response_status}"
-            ) from ex
+        if pending:
+            now = time.monotonic()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(
+                    executor.map(
+                        lambda job: job._client.retrieve_job(job._job_id), pending
+                    )
+                )
+            for job, response in zip(pending, responses):
+                job._last_poll_time = now
+                job._apply_response(response, raise_on_error=False)
+        return [job._status for job in jobs]
 
-        # Map it to a qiskit JobStatus key
-        try:
-            status_enum = constants.JobStatusMap[status_enum.name]
-        except ValueError as ex:
-            raise exceptions.IonQJobError(
-                f"Job status {status_enum} has no qiskit status mapping!"
-            ) from ex
+    def _apply_response(
+        self, response: dict, raise_on_error: bool = True
+    ) -> jobstatus.JobStatus:
+        """Update this job's status and metadata from an API job response.
 
-        # Get a qiskit status enum.
-        try:
-            self._status = jobstatus.JobStatus[status_enum.value]
-        except KeyError as ex:
-            raise exceptions.IonQJobError(
-                f"Qiskit has no JobStatus named '{status_enum}'"
-            ) from ex
+        Args:
+            response (dict): A job response from the IonQ API.
+            raise_on_error (bool): Whether to raise if the job failed.
 
-        if self._status in jobstatus.JOB_FINAL_STATES:
-            self._save_metadata(response)
+        Returns:
+            JobStatus: The job's new status.
 
-        if self._status == jobstatus.JobStatus.DONE:
-            self._num_circuits = response.get("circuits", 1)
-            self._children = response.get("children", [])
-            self._num_qubits = response.get("qubits", 0)
-            default_map = list(range(self._num_qubits))
-            self._clbits = (
-                [
-                    self._client.retrieve_job(job_id)
-                    .get("registers", {})
-                    .get("meas_mapped", default_map)
-                    for job_id in self._children
-                ]
-                if self._children
-                else [response.get("registers", {}).get("meas_mapped", default_map)]
-            )
-            self._execution_time = response["execution_time"] / 1000
-
-        if self._status == jobstatus.JobStatus.ERROR:
-            failure = response.get("failure") or {}
-            failure_type = failure.get("code", "")
-            failure_message = failure.get("error", "")
-            error_message = (
-                f"Unable to retreive result for job {self._job_id}. "
-                f'Failure from IonQ API "{failure_type}: {failure_message}"'
-            )
-            raise exceptions.IonQJobFailureError(error_message)
+        Raises:
+            IonQJobError: If the IonQ job status was unknown or otherwise
+                unmappable to a qiskit job status.
+            IonQJobFailureError: If the job fails and ``raise_on_error`` is True.
+        """
+        self._status = _to_qiskit_status(response.get("status"))
+        self._children = response.get("children", [])
 
-        if self._status == jobstatus.JobStatus.CANCELLED:
-            warning_message = (
-                f'Unable to retreive result for job {self._job_id}. Job was cancelled"'
-            )
-            warnings.warn(warning_message)
+        if self._status in _FINAL_STATES:
+            self._save_metadata(response)
+
+        handler = self._STATUS_HANDLERS.get(self._status)
+        if handler is not None and (
+            raise_on_error or self._status is not jobstatus.JobStatus.ERROR
+        ):
+            getattr(self, handler)(response)
 
         if "warning" in response and "messages" in response["warning"]:
             for warning in response["warning"]["messages"]:
                 warnings.warn(warning)
 
-        if detailed:
-            return self._children_status()
-
         return self._status
 
+    def _handle_done(self, response: dict) -> None:
+        """Record the result layout of a completed job.
+
+        Args:
+            response (dict): A job response from the IonQ API.
+        """
+        self._num_circuits = response.get("circuits", 1)
+        self._num_qubits = response.get("qubits", 0)
+        default_map = list(range(self._num_qubits))
+        self._clbits = (
+            [
+                child.get("registers", {}).get("meas_mapped", default_map)
+                for child in self._retrieve_children(self._children)
+            ]
+            if self._children
+            else [response.get("registers", {}).get("meas_mapped", default_map)]
+        )
+        execution_time = response.get("execution_time")
+        if execution_time is not None:
+            self._execution_time = execution_time / 1000
+
+    def _handle_error(self, response: dict) -> None:
+        """Raise the failure reported for a failed job.
+
+        Args:
+            response (dict): A job response from the IonQ API.
+
+        Raises:
+            IonQJobFailureError: Always.
+        """
+        failure = response.get("failure") or {}
+        failure_type = failure.get("code", "")
+        failure_message = failure.get("error", "")
+        error_message = (
+            f"Unable to retreive result for job {self._job_id}. "
+            f'Failure from IonQ API "{failure_type}: {failure_message}"'
+        )
+        raise exceptions.IonQJobFailureError(error_message)
+
+    def _handle_cancelled(self, response: dict) -> None:  # pylint: disable=unused-argument
+        """Warn that a cancelled job has no result.
+
+        Args:
+            response (dict): A job response from the IonQ API.
+        """
+        warning_message = (
+            f'Unable to retreive result for job {self._job_id}. Job was cancelled"'
+        )
+        warnings.warn(warning_message)
+
     def _children_status(self):
         """Retrieve the status of the children
 
@@ -424,37 +843,22 @@ class IonQJob(JobV1):
         Returns:
             dict: A dictionary containing the detailed status of the children.
         """
-        response = self._client.retrieve_job(self._job_id)
-        child_ids = response.get("children", [])
-        child_statuses = []
-
-        for child_id in child_ids:
-            response = self._client.retrieve_job(child_id)
-            api_response_status = response.get("status")
-
-            # Map API status to JobStatus enum
-            try:
-                status_enum = constants.APIJobStatus(api_response_status)
-            except ValueError as ex:
-                raise exceptions.IonQJobError(
-                    f"Unknown job status {api_response_status}"
-                ) from ex
-
-            try:
-                status_enum = constants.JobStatusMap[status_enum.name]
-            except ValueError as ex:
-                raise exceptions.IonQJobError(
-                    f"Job status {status_enum} has no qiskit status mapping!"
-                ) from ex
-
-            try:
-                qiskit_status = jobstatus.JobStatus[status_enum.value]
-            except KeyError as ex:
-                raise exceptions.IonQJobError(
-                    f"Qiskit has no JobStatus named '{status_enum}'"
-                ) from ex
-
-            child_statuses.append(qiskit_status)
+        # The parent's children are known once a full job response was applied;
+        # a submit acknowledgement does not list them.
+        if self._children is None:
+            response = self._client.retrieve_job(self._job_id)
+            child_ids = response.get("children", [])
+        else:
+            child_ids = self._children
+
+        # Only children that have not finished yet need to be polled again.
+        pending = [
+            child_id
+            for child_id in child_ids
+            if self._child_statuses.get(child_id) not in _FINAL_STATES
+        ]
+        self._retrieve_children(pending)
+        child_statuses = [self._child_statuses[child_id] for child_id in child_ids]
 
         total = len(child_statuses)
         completed = child_statuses.count(jobstatus.JobStatus.DONE)
@@ -471,6 +875,28 @@ class IonQJob(JobV1):
 
         return status_summary
 
+    def _retrieve_children(self, child_ids: list[str]) -> list[dict]:
+        """Fetch child jobs concurrently, recording each child's status.
+
+        Args:
+            child_ids (list[str]): IDs of the child jobs to fetch.
+
+        Returns:
+            list[dict]: The API response for each child, in the order given.
+
+        Raises:
+            IonQJobError: If a child job status was unknown.
+        """
+        if not child_ids:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_CHILD_WORKERS, len(child_ids))
+        ) as executor:
+            responses = list(executor.map(self._client.retrieve_job, child_ids))
+        for child_id, response in zip(child_ids, responses):
+            self._child_statuses[child_id] = _to_qiskit_status(response.get("status"))
+        return responses
+
     def _format_result(self, data):
         """Translate IonQ's result format into a qiskit Result instance.
 
@@ -498,28 +924,29 @@ class IonQJob(JobV1):
         # Format the inner result payload.
         success = self._status == jobstatus.JobStatus.DONE
         metadata = self._metadata.get("metadata", {})
-        sampler_seed = (
-            int(metadata.get("sampler_seed", ""))
-            if metadata.get("sampler_seed", "").isdigit()
-            else None
+        sampler_seed = _parse_count(metadata.get("sampler_seed"), None)
+        qiskit_header = self._qiskit_header(metadata.get("qiskit_header", None))
+        shots = _parse_count(metadata.get("shots"), 1024)
+        sort_counts = self._passed_args.get("sort_counts") or getattr(
+            backend.options, "sort_counts", None
         )
-        qiskit_header = decompress_metadata_string(metadata.get("qiskit_header", None))
-        if not isinstance(qiskit_header, list):
-            qiskit_header = [qiskit_header]
-        shots = (
-            int(metadata.get("shots", 1024))
-            if str(metadata.get("shots", "1024")).isdigit()
-            else 1024
+        legacy_rng = self._passed_args.get("legacy_rng") or getattr(
+            backend.options, "legacy_rng", False
         )
+        headers = [
+            (qiskit_header[i] if i < len(qiskit_header) else None) or {}
+            for i in range(self._num_circuits)
+        ]
         job_result = [
             {
                 "data": {},
                 "shots": shots,
-                "header": qiskit_header[i] or {},
+                "header": header,
                 "success": success,
             }
-            for i in range(self._num_circuits)
+            for header in headers
         ]
+        probability_arrays = []
         if self._status == jobstatus.JobStatus.DONE:
             # to handle ionq returning different data structures for single and multiple circuits
             if self._num_circuits > 1:
@@ -527,25 +954,28 @@ class IonQJob(JobV1):
             else:
                 data = [data]
             for i in range(self._num_circuits):
-                (counts, probabilities) = _build_counts(
+                (outcomes, count_values, probs) = _count_arrays(
                     data[i],
-                    qiskit_header[i].get("n_qubits", self._num_qubits),
+                    headers[i].get("n_qubits", self._num_qubits),
                     self._clbits[i],
                     shots,
                     use_sampler=is_ideal_simulator,
                     sampler_seed=sampler_seed,
+                    sort=sort_counts,
+                    legacy_rng=legacy_rng,
                 )
+                (counts, probabilities) = _counts_dicts(outcomes, count_values, probs)
+                probability_arrays.append((outcomes, probs))
                 job_result[i]["data"] = {
                     "counts": counts,
                     "probabilities": probabilities,
                     # Qiskit/experiments relies on this being present in this location in the
                     # ExperimentData class.
-                    "metadata": qiskit_header[i] or {},
+                    "metadata": headers[i],
                 }
 
         # Create a qiskit result to express the IonQ job result data.
-        backend = self.backend()
-        return Result.from_dict(
+        result = Result.from_dict(
             {
                 "results": job_result,
                 "job_id": self.job_id(),
@@ -556,6 +986,25 @@ class IonQJob(JobV1):
                 "time_taken": self._execution_time,
             }
         )
+        if probability_arrays:
+            result.set_probability_arrays(probability_arrays)
+        return result
+
+    def _qiskit_header(self, compressed: Optional[str]) -> list:
+        """Decompress the job's qiskit headers, reusing the last decompression.
+
+        Args:
+            compressed (str): The compressed ``qiskit_header`` metadata string.
+
+        Returns:
+            list: One header per circuit in the job.
+        """
+        if self._header_cache is None or self._header_cache[0] != compressed:
+            header = decompress_metadata_string(compressed)
+            if not isinstance(header, list):
+                header = [header]
+            self._header_cache = (compressed, header)
+        return self._header_cache[1]
 
     def _save_metadata(self, response):
         """Save metadata from the response to the job instance.
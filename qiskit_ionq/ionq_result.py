@@ -28,6 +28,7 @@
 IonQ result implementation that extends to allow for retrieval of probabilities.
 """
 
+import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.result import Result
 from qiskit.result.counts import Counts
@@ -42,6 +43,12 @@ class IonQResult(Result):
     provide an API for retrieving result probabilities directly.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-experiment (outcomes, probabilities) arrays, set by the job that
+        # built this result so that they need not be parsed from the hex keys.
+        self._probability_arrays = None
+
     def get_probabilities(self, experiment=None):
         """
         Get probabilities for the experiment.
@@ -92,3 +99,71 @@ class IonQResult(Result):
         if len(dict_list) == 1:
             return dict_list[0]
         return dict_list
+
+    def set_probability_arrays(self, arrays):
+        """
+        Store per-experiment outcome and probability arrays for this result.
+
+        Args:
+            arrays (list(tuple(np.ndarray, np.ndarray))): One
+                ``(outcomes, probabilities)`` pair per experiment, in order.
+        """
+        for outcomes, probabilities in arrays:
+            outcomes.setflags(write=False)
+            probabilities.setflags(write=False)
+        self._probability_arrays = arrays
+
+    def get_probabilities_array(self, experiment=None):
+        """
+        Get probabilities for the experiment as NumPy arrays.
+
+        Unlike :meth:`get_probabilities`, outcomes are kept as integers rather
+        than formatted bitstrings, which suits vectorized post-processing.
+
+        Args:
+            experiment (Union[int, QuantumCircuit, Schedule, dict], optional): If provided, this
+                argument is used to get an experiment using Result's ``_get_experiment`` method.
+
+        Raises:
+            IonQJobError: A given experiment in our results had no probabilities.
+
+        Returns:
+            Union[tuple(np.ndarray, np.ndarray), list(tuple(np.ndarray, np.ndarray))]:
+                A read-only pair of ``int64`` outcomes and ``float64``
+                probabilities if the result list was size one, else a list with
+                one pair per experiment.
+        """
+        if experiment is None:
+            exp_keys = range(len(self.results))
+        else:
+            exp_keys = [experiment]
+
+        arrays = []
+        for key in exp_keys:
+            if self._probability_arrays is not None:
+                exp = self._get_experiment(key)
+                index = next(i for i, res in enumerate(self.results) if res is exp)
+                arrays.append(self._probability_arrays[index])
+                continue
+            data = self.data(key)
+            if "probabilities" not in data:
+                raise exceptions.IonQJobError(
+                    f'No probabilities for experiment "{key!r}"'
+                )
+            # Results not built by a job only carry the hex-keyed dict.
+            probabilities = data["probabilities"]
+            num_outcomes = len(probabilities)
+            outcomes = np.fromiter(
+                (int(outcome, 16) for outcome in probabilities),
+                dtype=np.int64,
+                count=num_outcomes,
+            )
+            values = np.fromiter(
+                probabilities.values(), dtype=float, count=num_outcomes
+            )
+            arrays.append((outcomes, values))
+
+        # Return first item of arrays if size is 1
+        if len(arrays) == 1:
+            return arrays[0]
+        return arrays
@@ -83,7 +83,7 @@ setup(
     python_requires=">=3.9",
     setup_requires=[],
     install_requires=REQUIREMENTS,
-    extras_require={"test": TEST_REQUIREMENTS},
+    extras_require={"test": TEST_REQUIREMENTS, "orjson": ["orjson>=3.6"]},
     zip_safe=False,
     include_package_data=True,
     package_data={"qiskit_ionq": ["py.typed"]},
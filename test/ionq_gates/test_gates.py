@@ -31,8 +31,11 @@ import numpy as np
 
 import pytest
 
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
 from qiskit.circuit.library import XGate, YGate, RXGate, RYGate, HGate
-from qiskit_ionq import GPIGate, GPI2Gate, MSGate, ZZGate
+from qiskit_ionq import GPIGate, GPI2Gate, MSGate, ZZGate, add_equivalences
+from qiskit_ionq import ionq_gates
 
 
 @pytest.mark.parametrize("gate,phase", [(XGate(), 0), (YGate(), 0.25)])
@@ -97,6 +100,13 @@ def test_ms_inverse(params):
     np.testing.assert_array_almost_equal(mat.dot(mat.conj().T), np.identity(4))
 
 
+def test_ms_array_dtype():
+    """Tests that MS arrays are cast to the requested dtype like other gates."""
+    assert MSGate(0.1, 0.2, 0.3).__array__(np.complex64).dtype == np.complex64
+    with pytest.warns(Warning, match="Casting complex values to real"):
+        assert np.array(MSGate(0.1, 0.2, 0.3), dtype=float).dtype == float
+
+
 @pytest.mark.parametrize(
     "angle",
     [0, 0.1, 0.4, np.pi / 2, np.pi, 2 * np.pi],
@@ -107,3 +117,95 @@ def test_zz_inverse(angle):
 
     mat = np.array(gate)
     np.testing.assert_array_almost_equal(mat.dot(mat.conj().T), np.identity(4))
+
+
+@pytest.mark.parametrize(
+    "gate", [GPIGate(0.1), GPI2Gate(0.1), MSGate(0.1, 0.2, 0.3), ZZGate(0.1)]
+)
+def test_to_matrix_dtype(gate):
+    """Tests that gate matrices are C-contiguous complex128 and castable."""
+    mat = gate.to_matrix()
+    assert mat.dtype == np.complex128
+    assert mat.flags.c_contiguous
+    np.testing.assert_array_almost_equal(gate.__array__(np.complex64), mat)
+    assert gate.__array__(np.complex64).dtype == np.complex64
+
+
+@pytest.mark.parametrize(
+    "gate", [GPIGate(0.1), GPI2Gate(0.1), MSGate(0.1, 0.2, 0.3), ZZGate(0.1)]
+)
+def test_to_matrix_out(gate):
+    """Tests that to_matrix can fill a reused, dirty output buffer."""
+    expected = gate.to_matrix()
+    out = np.full_like(expected, 7)
+    assert gate.to_matrix(out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize("gate", [GPIGate, GPI2Gate, ZZGate])
+def test_bound_parameter_expression(gate):
+    """Tests that gates accept fully bound ParameterExpressions."""
+    theta = Parameter("theta")
+    expr = (2 * theta).bind({theta: 0.1})
+    np.testing.assert_array_almost_equal(gate(expr).to_matrix(), gate(0.2).to_matrix())
+
+
+@pytest.mark.parametrize(
+    "angle",
+    [0, 0.1, 0.4, np.pi / 2, np.pi, 2 * np.pi],
+)
+def test_zz_diagonal(angle):
+    """Tests that the ZZ gate diagonal matches its dense matrix."""
+    gate = ZZGate(angle)
+    np.testing.assert_array_equal(np.diag(gate.diagonal()), gate.to_matrix())
+
+
+def test_zz_diagonal_copies():
+    """Tests that cached ZZ diagonals are handed out as writable copies."""
+    diag = ZZGate(0.3).diagonal()
+    expected = diag.copy()
+    diag[0] = 0
+    np.testing.assert_array_equal(ZZGate(0.3).diagonal(), expected)
+
+
+@pytest.mark.parametrize(
+    "batch,gate",
+    [
+        (ionq_gates.gpi_batch, GPIGate),
+        (ionq_gates.gpi2_batch, GPI2Gate),
+        (ionq_gates.zz_batch, ZZGate),
+    ],
+)
+def test_single_parameter_batch(batch, gate):
+    """Tests that batched matrices match the per-gate matrices."""
+    phases = np.array([[0, 0.1, 0.4], [np.pi / 2, np.pi, 2 * np.pi]])
+    mats = batch(phases)
+    assert mats.shape == phases.shape + mats.shape[-2:]
+    for idx in np.ndindex(phases.shape):
+        np.testing.assert_array_almost_equal(mats[idx], gate(phases[idx]).to_matrix())
+    np.testing.assert_array_equal(gate.matrices(phases), mats)
+
+
+def test_ms_batch():
+    """Tests that batched MS matrices broadcast and match the per-gate matrices."""
+    phi0s = np.array([0, 0.1, 0.4, np.pi / 2])
+    mats = ionq_gates.ms_batch(phi0s, 1, [0.25, 0.1, 0.5, 0.3])
+    assert mats.shape == (4, 4, 4)
+    for i, (phi0, theta) in enumerate(zip(phi0s, [0.25, 0.1, 0.5, 0.3])):
+        np.testing.assert_array_almost_equal(
+            mats[i], MSGate(phi0, 1, theta).to_matrix()
+        )
+    np.testing.assert_array_equal(
+        MSGate.matrices(phi0s, 1, [0.25, 0.1, 0.5, 0.3]), mats
+    )
+
+
+def test_add_equivalences_once():
+    """Tests that repeated calls do not register duplicate equivalences."""
+    gate = GPIGate(Parameter("phi"))
+    # Start from an empty cache so the result does not depend on test order.
+    add_equivalences.cache_clear()
+    add_equivalences()
+    num_entries = len(SessionEquivalenceLibrary.get_entry(gate))
+    add_equivalences()
+    assert len(SessionEquivalenceLibrary.get_entry(gate)) == num_entries
@@ -29,13 +29,14 @@
 from unittest import mock
 import warnings
 
+import numpy as np
 import pytest
 from qiskit import QuantumCircuit
 from qiskit.providers import exceptions as q_exc
 from qiskit.providers import jobstatus
 
 from qiskit.qobj.utils import MeasLevel
-from qiskit_ionq import exceptions, ionq_job
+from qiskit_ionq import exceptions, ionq_job, ionq_result
 
 from .. import conftest
 
@@ -175,6 +176,10 @@ def spy(instance, attr):
             },
         ),
         (2, {0: 0.499, 3: 0.499}, [], {}),
+        (2, {1: 0.25, 2: 0.75}, [5, 1], {0: 0.25, 2: 0.75}),
+        (2, {"3": 0.5, "1": 0.5}, [1], {1: 0.5, 0: 0.5}),
+        (2, {"2": 0.5, "1": 0.5}, [0, 1], {2: 0.5, 1: 0.5}),
+        (2, {"1": 0.5, "5": 0.5}, [0, 1], {1: 1.0}),
     ],
 )
 def test_map_output(histogram, clbits, qubits, mapped_histogram):
@@ -182,12 +187,81 @@ def test_map_output(histogram, clbits, qubits, mapped_histogram):
     assert mapped_histogram == ionq_job.map_output(histogram, clbits, qubits)
 
 
+@pytest.mark.parametrize("clbits", [[6, None, 0], [6, 5, 4, 3, 2, 1, 0, None, 0, 6]])
+def test_map_output__large(clbits):
+    """Test that large histograms are remapped like small ones."""
+    histogram = {str(value): 1 / 128 for value in range(128)}
+    expected = {}
+    for value in range(128):
+        outvalue = 0
+        for position, bit in enumerate(clbits):
+            if bit is not None:
+                outvalue |= ((value >> bit) & 1) << position
+        expected[outvalue] = expected.get(outvalue, 0) + 1 / 128
+    assert ionq_job.map_output(histogram, clbits, 7) == pytest.approx(expected)
+    assert list(ionq_job.map_output(histogram, clbits, 7)) == list(expected)
+
+
 def test_build_counts__bad_input():
     """Test that _build_counts raises specific exceptions based on provided input."""
     with pytest.raises(exceptions.IonQJobError) as exc_info:
         ionq_job._build_counts(None, 1, [], 100)
     assert exc_info.value.message == "Cannot remap counts without data!"
 
+    with pytest.raises(exceptions.IonQJobError) as exc_info:
+        ionq_job._build_counts({"0": 0.0, "1": 0.0}, 1, [0], 100, use_sampler=True)
+    assert exc_info.value.message == (
+        "Cannot sample counts from an empty probability distribution!"
+    )
+
+
+@pytest.mark.parametrize("use_sampler", [False, True])
+def test_build_counts__no_clbits(use_sampler):
+    """Test that _build_counts returns empty results when nothing is measured."""
+    assert ionq_job._build_counts(
+        {"0": 0.5, "1": 0.5}, 1, [], 100, use_sampler=use_sampler
+    ) == ({}, {})
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, 1024), ("200", 200), (50, 50), ("x", 1024), ("-5", 1024), ("None", 1024)],
+)
+def test_parse_count(value, expected):
+    """Test that _parse_count parses non-negative ints, else the default."""
+    assert ionq_job._parse_count(value, 1024) == expected
+
+
+def test_build_counts__shots_sum():
+    """Test that QPU counts always add up to the requested shots."""
+    counts, _ = ionq_job._build_counts(
+        {"0": 1 / 3, "1": 1 / 3, "2": 1 / 3}, 2, [0, 1], 100
+    )
+    assert sum(counts.values()) == 100
+    assert sorted(counts.values()) == [33, 33, 34]
+
+
+@pytest.mark.parametrize(
+    "sort,expected",
+    [
+        (None, ["0x2", "0x0", "0x1"]),
+        ("key", ["0x0", "0x1", "0x2"]),
+        ("value", ["0x1", "0x2", "0x0"]),
+    ],
+)
+def test_build_counts__sort(sort, expected):
+    """Test that _build_counts can order its output by key or by count."""
+    counts, probabilities = ionq_job._build_counts(
+        {"2": 0.3, "0": 0.2, "1": 0.5}, 2, [0, 1], 10, sort=sort
+    )
+    assert list(counts) == list(probabilities) == expected
+
+
+def test_build_counts__bad_sort():
+    """Test that _build_counts rejects unknown sort orders."""
+    with pytest.raises(exceptions.IonQJobError):
+        ionq_job._build_counts({"0": 1.0}, 1, [0], 10, sort="bogus")
+
 
 def test_build_counts():
     """Test basic count remapping."""
@@ -198,6 +272,15 @@ def test_build_counts():
     assert ({"0x5": 0.5, "0x7": 0.5}) == probabilties
 
 
+def test_build_counts__zero_counts():
+    """Test that outcomes rounding to zero counts are dropped from both dicts."""
+    (counts, probabilties) = ionq_job._build_counts(
+        {"0": 0.99, "1": 0.004, "6": 0.006}, 3, [0, 1, 2], 100
+    )
+    assert ({"0x0": 99, "0x6": 1}) == counts
+    assert ({"0x0": 0.99, "0x6": 0.006}) == probabilties
+
+
 def test_results_meta(formatted_result):
     """Test basic job attribute values."""
     assert formatted_result.backend_name.startswith("ionq_qpu")
@@ -220,6 +303,21 @@ def test_probabilities(formatted_result):
     assert {"00": 0.5, "10": 0.499999} == probabilities
 
 
+def test_probabilities_array(formatted_result):
+    """Test probabilities as an (outcome, probability) array."""
+    outcomes, probabilities = formatted_result.get_probabilities_array()
+    assert outcomes.dtype == np.int64
+    np.testing.assert_array_equal(outcomes, [0, 2])
+    np.testing.assert_array_equal(probabilities, [0.5, 0.499999])
+    assert not outcomes.flags.writeable
+
+    # Results not built by a job are parsed from their hex keys.
+    rebuilt = ionq_result.IonQResult.from_dict(formatted_result.to_dict())
+    outcomes, probabilities = rebuilt.get_probabilities_array(0)
+    np.testing.assert_array_equal(outcomes, [0, 2])
+    np.testing.assert_array_equal(probabilities, [0.5, 0.499999])
+
+
 def test_counts__simulator_probs(simulator_backend, requests_mock):
     """Test that the simulator uses the sampler to produce counts and probs"""
     # Dummy job ID for formatted results fixture.
@@ -237,10 +335,23 @@ def test_counts__simulator_probs(simulator_backend, requests_mock):
     counts = formatted_result.get_counts()
     probabilities = formatted_result.get_probabilities()
 
-    assert {"00": 609, "10": 625} == counts
+    assert {"00": 633, "10": 601} == counts
     assert {"00": 0.5, "10": 0.499999} == probabilities
 
 
+def test_counts__legacy_rng(simulator_backend, requests_mock):
+    """Test that ``legacy_rng`` reproduces counts from the legacy sampler."""
+    job_id = "test_id"
+    path = simulator_backend.client.make_path("jobs", job_id)
+    requests_mock.get(path, json=conftest.dummy_job_response(job_id))
+    results_path = simulator_backend.client.make_path("jobs", job_id, "results")
+    requests_mock.get(results_path, json={"0": 0.5, "2": 0.499999})
+    simulator_backend.set_options(legacy_rng=True)
+    job = ionq_job.IonQJob(simulator_backend, job_id)
+
+    assert {"00": 609, "10": 625} == job.result().get_counts()
+
+
 def test_build_counts__with_int():
     """Test that a result with an integer doesn't break everything."""
     counts, probabilties = ionq_job._build_counts(
@@ -264,7 +375,7 @@ def test_counts_and_probs_from_job(simulator_backend, requests_mock):
 
     counts = job.get_counts()
     probabilities = job.get_probabilities()
-    assert {"00": 609, "10": 625} == counts
+    assert {"00": 633, "10": 601} == counts
     assert {"00": 0.5, "10": 0.499999} == probabilities
 
 
@@ -324,6 +435,62 @@ def test_submit(mock_backend, requests_mock):
     assert job._job_id == "server_job_id"
 
 
+def test_submit__records_status(mock_backend, requests_mock):
+    """Test that the status in the submit response spares an immediate poll.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    client = mock_backend.client
+    requests_mock.post(
+        client.make_path("jobs"),
+        status_code=200,
+        json={"id": "server_job_id", "status": "ready"},
+    )
+    job = ionq_job.IonQJob(mock_backend, None, circuit=QuantumCircuit(1, 1))
+    job.submit()
+
+    with spy(client, "retrieve_job") as job_fetch_spy:
+        assert job.status() is jobstatus.JobStatus.QUEUED
+    job_fetch_spy.assert_not_called()
+
+
+def test_submit__detailed_status(mock_backend, requests_mock):
+    """Test that detailed status right after submit still lists the children.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    client = mock_backend.client
+    job_id = "server_job_id"
+    child_ids = ["child_1", "child_2"]
+    requests_mock.post(
+        client.make_path("jobs"),
+        status_code=200,
+        json={"id": job_id, "status": "ready"},
+    )
+    requests_mock.get(
+        client.make_path("jobs", job_id),
+        status_code=200,
+        json=conftest.dummy_job_response(job_id, status="running", children=child_ids),
+    )
+    for child_id in child_ids:
+        requests_mock.get(
+            client.make_path("jobs", child_id),
+            status_code=200,
+            json=conftest.dummy_job_response(child_id, status="running"),
+        )
+    job = ionq_job.IonQJob(mock_backend, None, circuit=QuantumCircuit(1, 1))
+    job.submit()
+
+    status = job.status(detailed=True)
+
+    assert status["total"] == 2
+    assert status["statuses"] == [jobstatus.JobStatus.RUNNING] * 2
+
+
 def test_cancel(mock_backend, requests_mock):
     """Test cancelling the job will use a client to cancel the job via the API.
 
@@ -374,7 +541,7 @@ def test_result__timeout(mock_backend, requests_mock):
     path = client.make_path("jobs", job_id)
     requests_mock.get(path, status_code=200, json=job_result)
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     # Patch `wait_for_final_state` to force throwing a timeout.
@@ -458,12 +625,78 @@ def test_result(mock_backend, requests_mock):
     results_path = client.make_path("jobs", job_id, "results")
     requests_mock.get(results_path, status_code=200, json={"0": 0.5, "2": 0.499999})
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     assert job.result().to_dict() == expected_result
 
 
+def test_result__header_decompressed_once(mock_backend, requests_mock):  # pylint: disable=invalid-name
+    """Test that repeated result() calls reuse the decompressed qiskit header.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    client = mock_backend.client
+    job_result = conftest.dummy_job_response(job_id)
+    requests_mock.get(
+        client.make_path("jobs", job_id), status_code=200, json=job_result
+    )
+    requests_mock.get(
+        client.make_path("jobs", job_id, "results"),
+        status_code=200,
+        json={"0": 0.5, "2": 0.499999},
+    )
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    with spy(ionq_job, "decompress_metadata_string") as decompress_spy:
+        first = job.result().to_dict()
+        second = job.result().to_dict()
+
+    decompress_spy.assert_called_once()
+    assert first == second == expected_result
+
+
+def test_result__cached(mock_backend, requests_mock):
+    """Test that results of a finished job are fetched once per sharpen value.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    client = mock_backend.client
+    requests_mock.get(
+        client.make_path("jobs", job_id),
+        status_code=200,
+        json=conftest.dummy_job_response(job_id),
+    )
+    requests_mock.get(
+        client.make_path("jobs", job_id, "results"),
+        status_code=200,
+        json={"0": 0.5, "2": 0.499999},
+    )
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    with spy(client, "get_results") as results_spy:
+        first = job.result()
+        assert job.result() is first
+        assert job.get_counts() == first.get_counts()
+        assert results_spy.call_count == 1
+        job.result(sharpen=True)
+        job.result(extra_query_params={"foo": "bar"})
+        job.result(extra_query_params={"foo": "bar"})
+        assert results_spy.call_count == 3
+        job.result(extra_query_params={"foo": {"unhashable": 1}})
+        job.result(refresh=True)
+        assert results_spy.call_count == 5
+        job.result(extra_query_params={1: "a", "b": 2})
+        job.result(extra_query_params={"b": 2, 1: "a"})
+        assert results_spy.call_count == 6
+
+
 def test_result__with_sharpen(mock_backend, requests_mock):
     """Test basic "happy path" for result fetching.
 
@@ -483,7 +716,7 @@ def test_result__with_sharpen(mock_backend, requests_mock):
     results_path = client.make_path("jobs", job_id, "results") + "?sharpen=false"
     requests_mock.get(results_path, status_code=200, json={"0": 0.5, "2": 0.499999})
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     assert job.result(sharpen=False).to_dict() == expected_result
@@ -508,7 +741,7 @@ def test_result__with_extra_payload(mock_backend, requests_mock):
     results_path = client.make_path("jobs", job_id, "results") + "?sharpen=false"
     requests_mock.get(results_path, status_code=200, json={"0": 0.5, "2": 0.499999})
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     assert (
@@ -535,7 +768,7 @@ def test_result__bad_sharpen(mock_backend, requests_mock):
     results_path = client.make_path("jobs", job_id, "results")
     requests_mock.get(results_path, status_code=200, json={"0": 0.5, "2": 0.499999})
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     with pytest.warns(UserWarning, match="Invalid sharpen type"):
@@ -615,6 +848,30 @@ def test_result__meas_mapped(mock_backend, requests_mock):
     assert res == {"01": 1234}  # 1234 shots, all 10(2) remapped to 01(1)
 
 
+def test_result__no_header(mock_backend, requests_mock):
+    """Test result fetching for a job whose metadata has no qiskit header.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    client = mock_backend.client
+    job_response = conftest.dummy_job_response(job_id)
+    del job_response["metadata"]["qiskit_header"]
+    requests_mock.get(
+        client.make_path("jobs", job_id), status_code=200, json=job_response
+    )
+    requests_mock.get(
+        client.make_path("jobs", job_id, "results"),
+        status_code=200,
+        json={"0": 0.5, "2": 0.5},
+    )
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    assert job.result().get_counts() == {"0": 617, "10": 617}
+
+
 def test_result__failed_from_api(mock_backend, requests_mock):
     """Test result fetching when the job fails on the API side (e.g. due to bad input)
 
@@ -647,6 +904,33 @@ def test_result__failed_from_api(mock_backend, requests_mock):
     assert 'Failure from IonQ API "ExampleError: example error"' in str(exc.value)
 
 
+def test_wait_for_final_state__failed(mock_backend, requests_mock):  # pylint: disable=invalid-name
+    """Test that waiting on a failed job records ERROR, and result() raises.
+
+    Args:
+        mock_backend (MockBackend): A mock IonQBackend.
+        requests_mock (:class:`request_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    client = mock_backend.client
+    fetch_path = client.make_path("jobs", job_id)
+    fetch = requests_mock.get(
+        fetch_path, status_code=200, json=conftest.dummy_failed_job(job_id)
+    )
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    job.wait_for_final_state()
+    assert job.status() is jobstatus.JobStatus.ERROR
+    with pytest.raises(exceptions.IonQJobFailureError) as exc:
+        job.result()
+    assert 'Failure from IonQ API "ExampleError: example error"' in str(exc.value)
+    assert fetch.call_count == 1
+
+    # A direct poll still raises by default.
+    with pytest.raises(exceptions.IonQJobFailureError):
+        ionq_job.IonQJob(mock_backend, job_id).status()
+
+
 def test_result__cancelled(mock_backend, requests_mock):
     """Test result fetching when the job is canceled on the API side.
 
@@ -715,8 +999,8 @@ def test_status__already_final_state(mock_backend, requests_mock):  # pylint: di
     fetch_path = client.make_path("jobs", job_id)
     requests_mock.get(fetch_path, status_code=200, json=job_result)
 
-    # Create a job ref (this does not call status, since circuit is not None).
-    job = ionq_job.IonQJob(mock_backend, "test_id")
+    # Create a job ref, eagerly fetching its status.
+    job = ionq_job.IonQJob(mock_backend, "test_id", lazy=False)
 
     # Call status:
     # fmt: off
@@ -764,7 +1048,7 @@ def test_status_with_detailed(mock_backend, requests_mock):
         json=child_job_2_response,
     )
 
-    # Create a job ref (this will call .status() to fetch our mock above)
+    # Create a job ref (status is fetched lazily from our mock above)
     job = ionq_job.IonQJob(mock_backend, job_id)
 
     # Call status with detailed=True
@@ -781,3 +1065,191 @@ def test_status_with_detailed(mock_backend, requests_mock):
 
     # Assert the detailed status
     assert detailed_status == expected_detailed_status
+
+    # Repeated detailed calls only re-poll the unfinished child.
+    with spy(client, "retrieve_job") as job_fetch_spy:
+        assert job.status(detailed=True) == expected_detailed_status
+    job_fetch_spy.assert_called_once_with(child_job_id_2)
+
+
+def test_status__recent_poll_is_reused(mock_backend, requests_mock):  # pylint: disable=invalid-name
+    """Test that back-to-back status() calls share a single API request.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`requests_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    client = mock_backend.client
+    requests_mock.get(
+        client.make_path("jobs", job_id),
+        status_code=200,
+        json=conftest.dummy_job_response(job_id, status="running"),
+    )
+
+    job = ionq_job.IonQJob(mock_backend, job_id)
+    assert job.status() is jobstatus.JobStatus.RUNNING
+    with spy(client, "retrieve_job") as job_fetch_spy:
+        assert job.status() is jobstatus.JobStatus.RUNNING
+
+    job_fetch_spy.assert_not_called()
+
+
+def test_wait_for_final_state__poll_interval(mock_backend):  # pylint: disable=invalid-name
+    """Test that polling starts at the poll interval and backs off.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+    """
+    job = ionq_job.IonQJob(
+        mock_backend,
+        None,
+        circuit=QuantumCircuit(1, 1),
+        passed_args={"shots": 1, "poll_interval": 2.5},
+    )
+    running = [jobstatus.JobStatus.RUNNING] * 3 + [jobstatus.JobStatus.DONE]
+    with (
+        mock.patch.object(job, "status", side_effect=list(running)),
+        mock.patch.object(ionq_job.time, "sleep") as sleep,
+    ):
+        job.wait_for_final_state()
+    assert [c.args[0] for c in sleep.call_args_list] == pytest.approx(
+        [2.5, 3.75, 5.625], rel=0.1
+    )
+
+    # An explicit wait is used as-is, subject to the floor.
+    with (
+        mock.patch.object(job, "status", side_effect=list(running)),
+        mock.patch.object(ionq_job.time, "sleep") as sleep,
+    ):
+        job.wait_for_final_state(wait=0)
+    assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.1, 0.1]
+    assert "poll_interval" not in job._passed_args
+
+
+def test_wait_for_final_state__timeout(mock_backend):  # pylint: disable=invalid-name
+    """Test that waiting gives up once the timeout has elapsed.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+    """
+    job = ionq_job.IonQJob(mock_backend, None, circuit=QuantumCircuit(1, 1))
+    with (
+        mock.patch.object(job, "status", return_value=jobstatus.JobStatus.RUNNING),
+        pytest.raises(q_exc.JobTimeoutError),
+    ):
+        job.wait_for_final_state(timeout=0.3, wait=0.1)
+
+
+def test_retrieved_job__is_lazy(mock_backend):
+    """Test that creating a job ref from an ID does not fetch its status.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+    """
+    with spy(mock_backend.client, "retrieve_job") as job_fetch_spy:
+        job = ionq_job.IonQJob(mock_backend, "test_id")
+
+    job_fetch_spy.assert_not_called()
+    assert job._status is jobstatus.JobStatus.INITIALIZING
+
+
+def test_poll_many(mock_backend, requests_mock):
+    """Test that poll_many fetches only pending jobs and applies each response.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`requests_mock.Mocker`): A requests mocker.
+    """
+    client = mock_backend.client
+    for job_id, status in (("job_a", "running"), ("job_b", "ready")):
+        requests_mock.get(
+            client.make_path("jobs", job_id),
+            status_code=200,
+            json=conftest.dummy_job_response(job_id, status=status),
+        )
+    jobs = mock_backend.retrieve_jobs(["job_a", "job_b"])
+    done_job = ionq_job.IonQJob(mock_backend, "job_c")
+    done_job._status = jobstatus.JobStatus.DONE
+
+    with spy(client, "retrieve_job") as job_fetch_spy:
+        statuses = ionq_job.IonQJob.poll_many(jobs + [done_job], max_workers=2)
+
+    assert statuses == [
+        jobstatus.JobStatus.RUNNING,
+        jobstatus.JobStatus.QUEUED,
+        jobstatus.JobStatus.DONE,
+    ]
+    assert sorted(c.args[0] for c in job_fetch_spy.call_args_list) == [
+        "job_a",
+        "job_b",
+    ]
+    assert [job._status for job in jobs] == statuses[:2]
+
+
+def test_poll_many__failed_job(mock_backend, requests_mock):
+    """Test that a failed job is reported as ERROR without aborting the batch.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`requests_mock.Mocker`): A requests mocker.
+    """
+    client = mock_backend.client
+    requests_mock.get(
+        client.make_path("jobs", "job_a"),
+        status_code=200,
+        json=conftest.dummy_failed_job("job_a"),
+    )
+    requests_mock.get(
+        client.make_path("jobs", "job_b"),
+        status_code=200,
+        json=conftest.dummy_job_response("job_b"),
+    )
+    jobs = [ionq_job.IonQJob(mock_backend, job_id) for job_id in ("job_a", "job_b")]
+
+    statuses = ionq_job.IonQJob.poll_many(jobs)
+
+    assert statuses == [jobstatus.JobStatus.ERROR, jobstatus.JobStatus.DONE]
+    assert [job._status for job in jobs] == statuses
+    with pytest.raises(exceptions.IonQJobFailureError):
+        jobs[0].result()
+
+
+def test_status__no_execution_time(mock_backend, requests_mock):  # pylint: disable=invalid-name
+    """Test that a completed job without an execution time still resolves.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`requests_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    response = conftest.dummy_job_response(job_id)
+    del response["execution_time"]
+    requests_mock.get(
+        mock_backend.client.make_path("jobs", job_id), status_code=200, json=response
+    )
+
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    assert job.status() is jobstatus.JobStatus.DONE
+    assert job._execution_time is None
+
+
+def test_status__unknown_api_status(mock_backend, requests_mock):  # pylint: disable=invalid-name
+    """Test that an unrecognised API status raises an IonQJobError.
+
+    Args:
+        mock_backend (MockBackend): A fake/mock IonQBackend.
+        requests_mock (:class:`requests_mock.Mocker`): A requests mocker.
+    """
+    job_id = "test_id"
+    requests_mock.get(
+        mock_backend.client.make_path("jobs", job_id),
+        status_code=200,
+        json=conftest.dummy_job_response(job_id, status="bogus"),
+    )
+    job = ionq_job.IonQJob(mock_backend, job_id)
+
+    with pytest.raises(exceptions.IonQJobError) as exc_info:
+        job.status()
+    assert exc_info.value.message == "Unknown job status bogus"